@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from aiohttp import ClientResponseError
@@ -13,11 +14,16 @@ from homeassistant.helpers import config_entry_oauth2_flow
 
 from .api import GoogleCalendarApiClient
 from .const import (
+    AUTH_ERROR_STATUSES,
+    CONF_BLOCK_ON_FIRST_REFRESH,
     CONF_CALENDAR_ID,
     CONF_CONSIDER_NONE_OUTSIDE_HOURS,
+    CONF_MAX_UPDATE_INTERVAL,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_BLOCK_ON_FIRST_REFRESH,
     DEFAULT_CALENDAR_ID,
     DEFAULT_CONSIDER_NONE_OUTSIDE_HOURS,
+    DEFAULT_MAX_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
 )
@@ -27,6 +33,11 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor", "calendar"]
 
+# One token-refresh lock per config entry. Kept across reloads so a setup that
+# overlaps an in-flight reload still serialises on the same lock; dropped when
+# the entry is removed.
+_REFRESH_LOCKS: dict[str, asyncio.Lock] = {}
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Google Calendar Working Location from a config entry."""
@@ -37,28 +48,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
+    token_lock = _REFRESH_LOCKS.setdefault(entry.entry_id, asyncio.Lock())
 
-    # Validate that we can get a valid token before proceeding.
+    # Validate that we can get a valid token before proceeding. Google may
+    # rotate the refresh token, so concurrent refreshes must not overlap.
     try:
-        await session.async_ensure_token_valid()
+        async with token_lock:
+            await session.async_ensure_token_valid()
     except ClientResponseError as err:
-        if err.status in (401, 403):
+        status = err.status
+        if status in AUTH_ERROR_STATUSES:
             raise ConfigEntryAuthFailed(
                 "Google Calendar credentials are invalid or have been revoked"
             ) from err
         raise ConfigEntryNotReady(
-            f"Could not connect to Google Calendar API (HTTP {err.status}): {err}"
+            f"Could not connect to Google Calendar API (HTTP {status}): {err}"
         ) from err
     except Exception as err:
         raise ConfigEntryNotReady(
             f"Unexpected error validating Google Calendar token: {err}"
         ) from err
 
-    api_client = GoogleCalendarApiClient(session)
+    api_client = GoogleCalendarApiClient(session, token_lock)
 
     options = entry.options
     calendar_id = options.get(CONF_CALENDAR_ID, DEFAULT_CALENDAR_ID)
     update_interval = options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+    max_update_interval = options.get(
+        CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+    )
     consider_none = options.get(
         CONF_CONSIDER_NONE_OUTSIDE_HOURS, DEFAULT_CONSIDER_NONE_OUTSIDE_HOURS
     )
@@ -69,10 +87,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         calendar_id,
         update_interval,
         consider_none,
+        max_update_interval,
     )
 
-    # Perform initial data fetch; raises ConfigEntryNotReady on failure.
-    await coordinator.async_config_entry_first_refresh()
+    if options.get(CONF_BLOCK_ON_FIRST_REFRESH, DEFAULT_BLOCK_ON_FIRST_REFRESH):
+        # Perform initial data fetch. async_refresh records failures instead
+        # of raising, so translate them into the setup exceptions HA expects.
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            err = coordinator.last_exception
+            if isinstance(err, ConfigEntryAuthFailed):
+                raise ConfigEntryAuthFailed(
+                    "Google Calendar credentials are invalid or have been revoked"
+                ) from err
+            raise ConfigEntryNotReady(
+                f"Initial working location fetch failed: {err}"
+            ) from err
+    else:
+        # Fetch in the background so platform setup (and HA startup) is not
+        # held up by the Calendar API; entities stay unavailable until then.
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_request_refresh(),
+            "working_location_initial_refresh",
+        )
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
@@ -92,6 +130,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop per-entry state when the config entry is deleted."""
+    _REFRESH_LOCKS.pop(entry.entry_id, None)
+
+
 async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the config entry when options are updated."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 from aiohttp import ClientResponseError
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson ships with Home Assistant; stdlib as a fallback
+    from json import loads as json_loads
+
 from .const import CALENDAR_API_URL
 
 _LOGGER = logging.getLogger(__name__)
@@ -15,9 +21,20 @@ _LOGGER = logging.getLogger(__name__)
 class GoogleCalendarApiClient:
     """Minimal wrapper around the Google Calendar Events.list endpoint."""
 
-    def __init__(self, oauth_session: Any) -> None:
-        """Initialise with an HA OAuth2Session."""
+    def __init__(
+        self, oauth_session: Any, token_lock: asyncio.Lock | None = None
+    ) -> None:
+        """Initialise with an HA OAuth2Session.
+
+        *token_lock* serialises token refreshes with other users of the same
+        config entry's credentials (see ``async_setup_entry``).
+        """
         self._session = oauth_session
+        self._token_lock = token_lock or asyncio.Lock()
+        # Incremental-sync state used by async_sync_working_location_events.
+        self._sync_window: tuple[str, str, str] | None = None
+        self._sync_token: str | None = None
+        self._etag: str | None = None
 
     async def async_get_working_location_events(
         self,
@@ -55,6 +72,108 @@ class GoogleCalendarApiClient:
             time_max,
         )
 
-        resp = await self._session.async_request("GET", url, params=params)
+        resp = await self._async_request(url, params=params)
         resp.raise_for_status()
-        return await resp.json()
+        return await resp.json(loads=json_loads)
+
+    async def async_sync_working_location_events(
+        self,
+        calendar_id: str,
+        time_min: str,
+        time_max: str,
+    ) -> tuple[dict[str, Any], bool]:
+        """Fetch workingLocation events that changed since the previous call.
+
+        The first call for a given calendar and window fetches the whole window
+        and stores Google's ``nextSyncToken``. Later calls for the same window
+        send that token instead, so the server only returns changed or
+        cancelled events. An expired token (HTTP 410) falls back to a single
+        full fetch.
+
+        Incremental responses are not limited to the window: Google returns
+        every changed working-location event on the calendar, so callers must
+        filter the items themselves.
+
+        Returns:
+            A ``(response, full_sync)`` tuple. When ``full_sync`` is True,
+            ``response["items"]`` is the complete event list for the window;
+            otherwise it only holds the changes since the previous call.
+
+        Raises:
+            aiohttp.ClientResponseError: on non-2xx HTTP responses (other than
+            a 410 answered by the full-fetch fallback).
+        """
+        window = (calendar_id, time_min, time_max)
+        if window != self._sync_window:
+            self._sync_window = window
+            self._sync_token = None
+            self._etag = None
+
+        url = CALENDAR_API_URL.format(calendar_id=calendar_id)
+
+        if self._sync_token is not None:
+            params = {
+                "syncToken": self._sync_token,
+                "singleEvents": "true",
+                "eventTypes": "workingLocation",
+            }
+            _LOGGER.debug(
+                "Fetching working location changes for calendar %s", calendar_id
+            )
+            try:
+                resp = await self._async_request(url, params=params)
+                resp.raise_for_status()
+            except ClientResponseError as err:
+                if err.status != 410:
+                    raise
+                _LOGGER.debug(
+                    "Sync token for calendar %s expired; doing a full fetch",
+                    calendar_id,
+                )
+                self._sync_token = None
+                self._etag = None
+            else:
+                response = await resp.json(loads=json_loads)
+                self._sync_token = response.get("nextSyncToken")
+                return response, False
+
+        params = {
+            "timeMin": time_min,
+            "timeMax": time_max,
+            "singleEvents": "true",
+            "orderBy": "startTime",
+            "eventTypes": "workingLocation",
+            "maxResults": "250",
+        }
+        kwargs: dict[str, Any] = {"params": params}
+        if self._etag is not None:
+            kwargs["headers"] = {"If-None-Match": self._etag}
+
+        _LOGGER.debug(
+            "Fetching working location events for calendar %s [%s, %s]",
+            calendar_id,
+            time_min,
+            time_max,
+        )
+
+        resp = await self._async_request(url, **kwargs)
+        resp.raise_for_status()
+        if resp.status == 304:
+            # Window unchanged since the last full fetch.
+            return {"items": []}, False
+
+        response = await resp.json(loads=json_loads)
+        self._sync_token = response.get("nextSyncToken")
+        self._etag = response.get("etag")
+        return response, True
+
+    async def _async_request(self, url: str, **kwargs: Any) -> Any:
+        """Issue a GET, refreshing the token under the shared lock first.
+
+        Only one refresh runs at a time; callers that waited on the lock find
+        the token already valid, which ``async_ensure_token_valid`` checks
+        itself before refreshing.
+        """
+        async with self._token_lock:
+            await self._session.async_ensure_token_valid()
+        return await self._session.async_request("GET", url, **kwargs)
@@ -11,11 +11,15 @@ from homeassistant.config_entries import ConfigEntry, OptionsFlow
 from homeassistant.helpers import config_entry_oauth2_flow
 
 from .const import (
+    CONF_BLOCK_ON_FIRST_REFRESH,
     CONF_CALENDAR_ID,
     CONF_CONSIDER_NONE_OUTSIDE_HOURS,
+    CONF_MAX_UPDATE_INTERVAL,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_BLOCK_ON_FIRST_REFRESH,
     DEFAULT_CALENDAR_ID,
     DEFAULT_CONSIDER_NONE_OUTSIDE_HOURS,
+    DEFAULT_MAX_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     OAUTH2_SCOPE,
@@ -84,6 +88,12 @@ class WorkingLocationOptionsFlow(OptionsFlow):
                     CONF_UPDATE_INTERVAL,
                     default=current.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_MAX_UPDATE_INTERVAL,
+                    default=current.get(
+                        CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                 vol.Optional(
                     CONF_CONSIDER_NONE_OUTSIDE_HOURS,
                     default=current.get(
@@ -91,6 +101,13 @@ class WorkingLocationOptionsFlow(OptionsFlow):
                         DEFAULT_CONSIDER_NONE_OUTSIDE_HOURS,
                     ),
                 ): bool,
+                vol.Optional(
+                    CONF_BLOCK_ON_FIRST_REFRESH,
+                    default=current.get(
+                        CONF_BLOCK_ON_FIRST_REFRESH,
+                        DEFAULT_BLOCK_ON_FIRST_REFRESH,
+                    ),
+                ): bool,
             }
         )
 
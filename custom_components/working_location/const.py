@@ -5,12 +5,16 @@ DOMAIN = "working_location"
 # Config/options keys
 CONF_CALENDAR_ID = "calendar_id"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
 CONF_CONSIDER_NONE_OUTSIDE_HOURS = "consider_none_outside_hours"
+CONF_BLOCK_ON_FIRST_REFRESH = "block_on_first_refresh"
 
 # Defaults
 DEFAULT_CALENDAR_ID = "primary"
 DEFAULT_UPDATE_INTERVAL = 5  # minutes
+DEFAULT_MAX_UPDATE_INTERVAL = 30  # minutes
 DEFAULT_CONSIDER_NONE_OUTSIDE_HOURS = False
+DEFAULT_BLOCK_ON_FIRST_REFRESH = False
 
 # OAuth
 OAUTH2_SCOPE = "https://www.googleapis.com/auth/calendar.events.readonly"
@@ -20,6 +24,9 @@ CALENDAR_API_URL = (
     "https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
 )
 
+# HTTP statuses that mean the OAuth credentials are no longer usable
+AUTH_ERROR_STATUSES = frozenset({401, 403})
+
 # Sensor states
 STATE_HOME_OFFICE = "homeOffice"
 STATE_OFFICE_LOCATION = "officeLocation"
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from aiohttp import ClientResponseError
 
+try:
+    from ciso8601 import parse_datetime as ciso8601_parse_datetime
+except ImportError:  # ciso8601 ships with Home Assistant; see _parse_rfc3339
+    ciso8601_parse_datetime = None
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -16,17 +24,50 @@ from homeassistant.util import dt as dt_util
 
 from .api import GoogleCalendarApiClient
 from .const import (
+    AUTH_ERROR_STATUSES,
+    DEFAULT_MAX_UPDATE_INTERVAL,
     DOMAIN,
     STATE_CUSTOM_LOCATION,
     STATE_HOME_OFFICE,
     STATE_NONE,
     STATE_OFFICE_LOCATION,
     STATE_UNKNOWN,
-    VALID_STATES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Adaptive polling bounds (see _next_update_interval)
+_MIN_UPDATE_INTERVAL = timedelta(minutes=1)
+_IDLE_LOOKAHEAD = timedelta(hours=2)
+# Added after a boundary so a slightly early poll still sees the change
+_BOUNDARY_GRACE = timedelta(seconds=5)
+
+_ONE_DAY = timedelta(days=1)
+
+# (source field, attribute name) pairs mirrored from workingLocationProperties
+# and its nested customLocation / officeLocation objects
+_WLP_PASSTHROUGH = (("homeOffice", "homeOffice"),)
+_CUSTOM_LOCATION_FIELDS = (("label", "customLocation_label"),)
+_OFFICE_LOCATION_FIELDS = (
+    ("buildingId", "officeLocation_buildingId"),
+    ("floorId", "officeLocation_floorId"),
+    ("floorSectionId", "officeLocation_floorSectionId"),
+    ("deskId", "officeLocation_deskId"),
+    ("label", "officeLocation_label"),
+)
+
+# Distinguishes "field absent" from "field present with value None"
+_MISSING = object()
+
+# Event keys under which _event_bound stores parsed start/end datetimes
+_BOUND_CACHE_KEYS = {"start": "_start_dt", "end": "_end_dt"}
+
+# Start-index key for events without a parsed start (all-day / unparseable);
+# also the end-index key for events that can never cover "now"
+_ALWAYS_STARTED = datetime.min.replace(tzinfo=timezone.utc)
+# End-index key for all-day events, which cover the whole day
+_NEVER_ENDS = datetime.max.replace(tzinfo=timezone.utc)
+
 
 class WorkingLocationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator that fetches and parses working location data."""
@@ -38,6 +79,7 @@ class WorkingLocationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         calendar_id: str,
         update_interval_minutes: int,
         consider_none_outside_hours: bool,
+        max_update_interval_minutes: int = DEFAULT_MAX_UPDATE_INTERVAL,
     ) -> None:
         """Initialise the coordinator."""
         super().__init__(
@@ -49,42 +91,218 @@ class WorkingLocationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._api_client = api_client
         self._calendar_id = calendar_id
         self._consider_none_outside_hours = consider_none_outside_hours
+        self._base_interval = timedelta(minutes=update_interval_minutes)
+        # Only idle periods may wait longer than the configured interval
+        self._idle_interval = max(
+            timedelta(minutes=max_update_interval_minutes), self._base_interval
+        )
+        # Today's events keyed by event ID, kept current via incremental sync.
+        self._events_cache: dict[str, dict[str, Any]] = {}
+        # Deduplicated cache contents sorted by start, plus parallel lists of
+        # parsed start/end times; rebuilt only when the cache changes.
+        self._sorted_events: list[dict[str, Any]] = []
+        self._event_index: tuple[list[datetime], list[datetime]] = ([], [])
+        # Today's local midnight → midnight window as (date, tzinfo, start,
+        # end, timeMin, timeMax); rebuilt when the local date or tz changes
+        self._last_window: tuple[
+            date, tzinfo | None, datetime, datetime, str, str
+        ] | None = None
+        # Last selected event and its parsed result, reused while unchanged.
+        self._last_selected: dict[str, Any] | None = None
+        self._last_result: dict[str, Any] | None = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch events and return parsed state + attributes dict."""
         now = dt_util.now()
 
         # Build today's window in HA's local timezone (midnight → midnight)
-        today_local = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow_local = today_local + timedelta(days=1)
+        window = self._last_window
+        if window is None or (window[0], window[1]) != (now.date(), now.tzinfo):
+            today_local = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            tomorrow_local = today_local + _ONE_DAY
+            window = self._last_window = (
+                now.date(),
+                now.tzinfo,
+                today_local,
+                tomorrow_local,
+                _midnight_rfc3339(today_local),
+                _midnight_rfc3339(tomorrow_local),
+            )
 
-        time_min = today_local.isoformat()
-        time_max = tomorrow_local.isoformat()
+        _, _, today_local, tomorrow_local, time_min, time_max = window
 
         try:
-            response = await self._api_client.async_get_working_location_events(
-                self._calendar_id, time_min, time_max
+            response, full_sync = (
+                await self._api_client.async_sync_working_location_events(
+                    self._calendar_id, time_min, time_max
+                )
             )
         except ClientResponseError as err:
-            if err.status in (401, 403):
+            # Retry at the configured cadence, not a stretched adaptive one
+            self.update_interval = self._base_interval
+            status = err.status
+            if status in AUTH_ERROR_STATUSES:
                 raise ConfigEntryAuthFailed(
                     "Google Calendar token is no longer valid"
                 ) from err
             raise UpdateFailed(
-                f"Error communicating with Google Calendar API (HTTP {err.status}): {err}"
+                f"Error communicating with Google Calendar API (HTTP {status}): {err}"
             ) from err
         except Exception as err:
+            self.update_interval = self._base_interval
             raise UpdateFailed(f"Unexpected error fetching working location: {err}") from err
 
-        events: list[dict[str, Any]] = response.get("items", [])
-        events = _deduplicate_by_day(events)
-        return _parse_events(events, now, self._calendar_id, self._consider_none_outside_hours)
+        items: list[dict[str, Any]] = response.get("items", [])
+        if full_sync:
+            self._events_cache = {event.get("id"): event for event in items}
+        else:
+            _merge_event_changes(
+                self._events_cache, items, today_local, tomorrow_local
+            )
+
+        if full_sync or items:
+            self._sorted_events, self._event_index = _build_event_index(
+                _drop_identical_events(
+                    _deduplicate_by_day(list(self._events_cache.values()))
+                )
+            )
+
+        selected = _select_event(
+            self._sorted_events,
+            now,
+            self._consider_none_outside_hours,
+            self._event_index,
+        )
+        if self._last_result is None or not _same_revision(
+            selected, self._last_selected
+        ):
+            self._last_result = _result_for_event(selected, self._calendar_id)
+            self._last_selected = selected
+        result = self._last_result
+
+        self.update_interval = _next_update_interval(
+            self._event_index,
+            now,
+            tomorrow_local,
+            self._base_interval,
+            self._idle_interval,
+            self._consider_none_outside_hours,
+        )
+        return result
 
 
 # ---------------------------------------------------------------------------
 # Pure parsing helpers (no HA imports needed, easy to unit-test)
 # ---------------------------------------------------------------------------
 
+def _midnight_rfc3339(day_start: datetime) -> str:
+    """Format a local midnight as ``YYYY-MM-DDT00:00:00±HH:MM``.
+
+    The offset comes from *day_start* itself, not from "now", so DST
+    transition days get the correct offset on each bound.
+    """
+    offset = day_start.strftime("%z")
+    if len(offset) != 5:
+        # Naive or sub-minute offset; let isoformat handle the odd case.
+        return day_start.isoformat()
+    return f"{day_start:%Y-%m-%d}T00:00:00{offset[:3]}:{offset[3:]}"
+
+
+def _merge_event_changes(
+    cache: dict[str, dict[str, Any]],
+    changes: list[dict[str, Any]],
+    window_start: datetime,
+    window_end: datetime,
+) -> None:
+    """Apply incremental-sync changes to *cache* in place.
+
+    Cancelled events, and events that no longer overlap the window (an
+    incremental response covers the whole calendar), are removed; everything
+    else is inserted or replaced by event ID.
+    """
+    for event in changes:
+        event_id = event.get("id")
+        if event.get("status") == "cancelled" or not _event_in_window(
+            event, window_start, window_end
+        ):
+            cache.pop(event_id, None)
+        else:
+            cache[event_id] = event
+
+
+def _event_in_window(
+    event: dict[str, Any], window_start: datetime, window_end: datetime
+) -> bool:
+    """Return True if the event overlaps [window_start, window_end)."""
+    start = event.get("start", {})
+    end = event.get("end", {})
+
+    if "dateTime" in start and "dateTime" in end:
+        start_dt, end_dt = _event_times(event)
+        if start_dt is None or end_dt is None:
+            return False
+        return start_dt < window_end and end_dt > window_start
+
+    if "date" in start and "date" in end:
+        # All-day dates are local calendar days; end date is exclusive.
+        day = window_start.date().isoformat()
+        return start["date"] <= day < end["date"]
+
+    return False
+
+
+def _next_update_interval(
+    index: tuple[list[datetime], list[datetime]],
+    now: datetime,
+    day_end: datetime,
+    base_interval: timedelta,
+    idle_interval: timedelta,
+    consider_none_outside_hours: bool,
+) -> timedelta:
+    """Return how long to wait before the next poll.
+
+    Polls a few seconds after the next event start/end (or local midnight),
+    since HA's scheduler may fire slightly early, but never waits longer
+    than *base_interval*. With ``consider_none_outside_hours``, when no
+    event covers *now* and none starts within two hours, the cap is
+    stretched to *idle_interval* if that is longer; idle polling never runs
+    more often than active polling.
+
+    *index* is the one built by ``_build_event_index``, so "covers now"
+    follows the same ``start <= now < end`` rule as ``_select_event``.
+    """
+    next_boundary = day_end
+    next_start: datetime | None = None
+    covering = False
+
+    for start, end in zip(*index):
+        if end is _ALWAYS_STARTED:
+            # Unparseable or open-ended: never covers, so never a boundary
+            continue
+        if start <= now < end:
+            covering = True
+        # Placeholder bounds never qualify: _ALWAYS_STARTED is never after
+        # now and _NEVER_ENDS is never before day_end
+        if now < start:
+            if next_start is None or start < next_start:
+                next_start = start
+            next_boundary = min(next_boundary, start)
+        if now < end < next_boundary:
+            next_boundary = end
+
+    ceiling = base_interval
+    if (
+        consider_none_outside_hours
+        and not covering
+        and (next_start is None or next_start - now > _IDLE_LOOKAHEAD)
+    ):
+        ceiling = max(idle_interval, base_interval)
+
+    return max(
+        _MIN_UPDATE_INTERVAL, min(next_boundary - now + _BOUNDARY_GRACE, ceiling)
+    )
+
+
 def _deduplicate_by_day(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """For each calendar day, prefer standalone events over recurring instances.
 
@@ -95,19 +313,13 @@ def _deduplicate_by_day(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
     from collections import defaultdict
 
-    def _day_key(event: dict[str, Any]) -> str:
+    def _start_key(event: dict[str, Any]) -> str:
         start = event.get("start", {})
-        dt = start.get("dateTime") or start.get("date", "")
-        return dt[:10]
-
-    events = sorted(
-        events,
-        key=lambda e: (e.get("start", {}).get("dateTime") or e.get("start", {}).get("date", "")),
-    )
+        return start.get("dateTime") or start.get("date", "")
 
     by_day: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for event in events:
-        by_day[_day_key(event)].append(event)
+    for event in sorted(events, key=_start_key):
+        by_day[_start_key(event)[:10]].append(event)
 
     result: list[dict[str, Any]] = []
     for day_events in by_day.values():
@@ -116,6 +328,85 @@ def _deduplicate_by_day(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
     return result
 
+
+def _drop_identical_events(
+    events: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Drop events repeating an earlier one's start, end and location.
+
+    Recurring series can yield several instances that are indistinguishable
+    for selection purposes; keeping only the first shrinks the index. The
+    location is compared by value, regardless of the API's key order.
+    """
+    seen: set[tuple[str | None, str | None, Any]] = set()
+    result: list[dict[str, Any]] = []
+    for event in events:
+        start = event.get("start", {})
+        end = event.get("end", {})
+        key = (
+            start.get("dateTime") or start.get("date"),
+            end.get("dateTime") or end.get("date"),
+            _freeze(event.get("workingLocationProperties")),
+        )
+        if key not in seen:
+            seen.add(key)
+            result.append(event)
+    return result
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable, key-order-independent form of a JSON value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _build_event_index(
+    events: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], tuple[list[datetime], list[datetime]]]:
+    """Sort *events* by start and parse their bounds for ``_select_event``.
+
+    Returns the sorted events and an index of two parallel lists holding
+    each event's start and end, so selection needs only comparisons. All-day
+    and unparseable events sort first, as they do in the API's own
+    ``startTime`` ordering. All-day events get an end that never passes;
+    events that can never cover "now" get one that always has.
+    """
+    keyed = sorted(
+        ((*_index_bounds(event), event) for event in events),
+        key=lambda entry: entry[0],
+    )
+    starts = [start for start, _, _ in keyed]
+    ends = [end for _, end, _ in keyed]
+    return [event for _, _, event in keyed], (starts, ends)
+
+
+def _index_bounds(event: dict[str, Any]) -> tuple[datetime, datetime]:
+    """Return the (start, end) index keys for one event.
+
+    An event covers *now* exactly when ``start <= now < end`` holds for
+    these keys (see ``_event_covers_now``). The all-day check happens here,
+    once per index build, so selection never branches on event kind.
+    """
+    start = event.get("start") or {}
+    start_str = start.get("dateTime")
+    if start_str is None:
+        return _ALWAYS_STARTED, _NEVER_ENDS if "date" in start else _ALWAYS_STARTED
+    start_dt = _event_bound(event, "start")
+    end_str = (event.get("end") or {}).get("dateTime")
+    if end_str is None:
+        return start_dt or _ALWAYS_STARTED, _ALWAYS_STARTED
+    end_dt = _event_bound(event, "end")
+    if start_dt is None or end_dt is None:
+        _LOGGER.debug(
+            "Failed to parse event times: start=%s, end=%s", start_str, end_str
+        )
+        return start_dt or _ALWAYS_STARTED, _ALWAYS_STARTED
+    return start_dt, end_dt
+
+
 def _parse_events(
     events: list[dict[str, Any]],
     now: datetime,
@@ -124,55 +415,128 @@ def _parse_events(
 ) -> dict[str, Any]:
     """Parse a list of working-location events into state + attributes.
 
+    One-shot form of what the coordinator does per tick: build the event
+    index, then apply ``_select_event``; when it selects nothing the state
+    is ``none``. The coordinator keeps the index between ticks instead.
+    """
+    events, index = _build_event_index(events)
+    selected = _select_event(events, now, consider_none_outside_hours, index)
+    return _result_for_event(selected, calendar_id)
+
+
+def _result_for_event(
+    selected: dict[str, Any] | None, calendar_id: str
+) -> dict[str, Any]:
+    """Return state + attributes for the selected event (``none`` if None)."""
+    if selected is None:
+        return {
+            "state": STATE_NONE,
+            "attributes": MappingProxyType({"calendar_id": calendar_id}),
+        }
+    return _extract_state_and_attrs(selected, calendar_id)
+
+
+def _select_event(
+    events: list[dict[str, Any]],
+    now: datetime,
+    consider_none_outside_hours: bool,
+    index: tuple[list[datetime], list[datetime]],
+) -> dict[str, Any] | None:
+    """Pick the event that determines the sensor state, if any.
+
     Selection logic:
     1. Prefer the event whose time range covers *now*.
     2. Fall back to the earliest event in the day (first in list; API orders
-       by startTime).
-    3. If no events: state = ``none``.
+       by startTime), unless *consider_none_outside_hours* is set.
+    3. If no events: None.
+
+    *events* and *index* come from ``_build_event_index``: the search
+    bisects past events that start after *now* and checks the rest with a
+    single end-time comparison. Since *events* is sorted by start, the
+    search stops at the first covering event and the fallback is simply the
+    first element, with no second scan for the earliest.
     """
     if not events:
-        return {"state": STATE_NONE, "attributes": {"calendar_id": calendar_id}}
+        return None
 
-    # Try to find an event that covers "now"
-    selected: dict[str, Any] | None = None
-    for event in events:
-        if _event_covers_now(event, now):
-            selected = event
-            break
+    # Take the first event that covers "now", stopping as soon as one does
+    starts, ends = index
+    covering = next(
+        (events[i] for i in range(bisect_right(starts, now)) if now < ends[i]),
+        None,
+    )
+    if covering is not None:
+        return covering
 
-    if selected is None:
-        if consider_none_outside_hours:
-            # No event covering now → treat as none
-            return {"state": STATE_NONE, "attributes": {"calendar_id": calendar_id}}
-        # Fall back to earliest event
-        selected = events[0]
+    if consider_none_outside_hours:
+        # No event covering now → treat as none
+        return None
+    # Fall back to earliest event
+    return events[0]
 
-    return _extract_state_and_attrs(selected, calendar_id)
+
+def _same_revision(a: dict[str, Any] | None, b: dict[str, Any] | None) -> bool:
+    """Return True if *a* and *b* are the same revision of the same event.
+
+    Relies on the API's ``updated`` timestamp; events without one only match
+    themselves.
+    """
+    if a is b:
+        return True
+    if a is None or b is None or a.get("updated") is None:
+        return False
+    return a.get("id") == b.get("id") and a.get("updated") == b.get("updated")
 
 
 def _event_covers_now(event: dict[str, Any], now: datetime) -> bool:
-    """Return True if the event's time range includes *now*."""
-    start = event.get("start", {})
-    end = event.get("end", {})
+    """Return True if the event's time range includes *now*.
 
-    if "dateTime" in start and "dateTime" in end:
-        # Timed event — parse and compare
-        start_dt = dt_util.parse_datetime(start["dateTime"])
-        end_dt = dt_util.parse_datetime(end["dateTime"])
-        if start_dt is not None and end_dt is not None:
-            return start_dt <= now < end_dt
-        _LOGGER.debug(
-            "Failed to parse event times: start=%s, end=%s",
-            start.get("dateTime"),
-            end.get("dateTime"),
-        )
-        return False
+    All-day events always do; see ``_index_bounds`` for the rule.
+    """
+    start, end = _index_bounds(event)
+    return start <= now < end
 
-    if "date" in start:
-        # All-day event — always covers any moment during the day
-        return True
 
-    return False
+def _event_times(
+    event: dict[str, Any],
+) -> tuple[datetime | None, datetime | None]:
+    """Return the parsed start/end of a timed event.
+
+    Either value is None for all-day events or unparseable timestamps.
+    """
+    return _event_bound(event, "start"), _event_bound(event, "end")
+
+
+def _event_bound(event: dict[str, Any], key: str) -> datetime | None:
+    """Return the parsed ``start`` or ``end`` dateTime of an event.
+
+    The result is stored on the event under ``_start_dt`` / ``_end_dt`` so
+    events kept in the coordinator's cache are parsed once, not every tick.
+    """
+    cache_key = _BOUND_CACHE_KEYS[key]
+    if cache_key in event:
+        return event[cache_key]
+    value = event.get(key, {}).get("dateTime")
+    parsed = _parse_rfc3339(value) if value is not None else None
+    event[cache_key] = parsed
+    return parsed
+
+
+@lru_cache(maxsize=512)
+def _parse_rfc3339(value: str) -> datetime | None:
+    """Parse an RFC3339 timestamp; memoised since the same strings recur.
+
+    Uses the ciso8601 C parser when available, otherwise (or for input it
+    rejects) ``dt_util.parse_datetime``. Unparseable input is cached as None
+    rather than raising. The cache is only touched from the event loop, so
+    lru_cache's own locking suffices.
+    """
+    if ciso8601_parse_datetime is None:
+        return dt_util.parse_datetime(value)
+    try:
+        return ciso8601_parse_datetime(value)
+    except ValueError:
+        return dt_util.parse_datetime(value)
 
 
 def _extract_state_and_attrs(
@@ -182,35 +546,13 @@ def _extract_state_and_attrs(
     wlp: dict[str, Any] = event.get("workingLocationProperties", {})
     loc_type: str | None = wlp.get("type")
 
-    # Determine state
-    if loc_type in VALID_STATES:
-        state = loc_type
-    else:
-        state = STATE_UNKNOWN
+    # Determine state and mirror the matching workingLocationProperties fields
+    state, mirror = _WLP_HANDLERS.get(loc_type, (STATE_UNKNOWN, _mirror_unknown))
 
     attrs: dict[str, Any] = {"calendar_id": calendar_id}
-
-    # Mirror workingLocationProperties fields
     if loc_type:
         attrs["type"] = loc_type
-
-    if "homeOffice" in wlp:
-        attrs["homeOffice"] = wlp["homeOffice"]
-
-    if "customLocation" in wlp:
-        cl = wlp["customLocation"]
-        if "label" in cl:
-            attrs["customLocation_label"] = cl["label"]
-
-    if "officeLocation" in wlp:
-        ol: dict[str, Any] = wlp["officeLocation"]
-        for field in ("buildingId", "floorId", "floorSectionId", "deskId", "label"):
-            if field in ol:
-                attrs[f"officeLocation_{field}"] = ol[field]
-
-    # Attach raw workingLocationProperties when type is unrecognised
-    if state == STATE_UNKNOWN and wlp:
-        attrs["workingLocationProperties"] = wlp
+    mirror(wlp, attrs)
 
     # Operational extras
     attrs["event_id"] = event.get("id")
@@ -220,4 +562,51 @@ def _extract_state_and_attrs(
     attrs["start"] = start.get("dateTime") or start.get("date")
     attrs["end"] = end.get("dateTime") or end.get("date")
 
-    return {"state": state, "attributes": attrs}
+    # Read-only: the coordinator hands the same result out on later ticks.
+    return {"state": state, "attributes": MappingProxyType(attrs)}
+
+
+def _mirror_home_office(wlp: dict[str, Any], attrs: dict[str, Any]) -> None:
+    """Mirror homeOffice fields into *attrs*."""
+    _copy_fields(wlp, _WLP_PASSTHROUGH, attrs)
+
+
+def _mirror_custom_location(wlp: dict[str, Any], attrs: dict[str, Any]) -> None:
+    """Mirror customLocation fields into *attrs*."""
+    _copy_fields(wlp.get("customLocation"), _CUSTOM_LOCATION_FIELDS, attrs)
+
+
+def _mirror_office_location(wlp: dict[str, Any], attrs: dict[str, Any]) -> None:
+    """Mirror officeLocation fields into *attrs*."""
+    _copy_fields(wlp.get("officeLocation"), _OFFICE_LOCATION_FIELDS, attrs)
+
+
+def _mirror_unknown(wlp: dict[str, Any], attrs: dict[str, Any]) -> None:
+    """Mirror whatever known fields exist, plus the raw properties."""
+    _mirror_home_office(wlp, attrs)
+    _mirror_custom_location(wlp, attrs)
+    _mirror_office_location(wlp, attrs)
+    # Attach raw workingLocationProperties when type is unrecognised
+    if wlp:
+        attrs["workingLocationProperties"] = wlp
+
+
+# workingLocationProperties.type → (sensor state, attribute mirroring handler)
+_WLP_HANDLERS = {
+    STATE_HOME_OFFICE: (STATE_HOME_OFFICE, _mirror_home_office),
+    STATE_OFFICE_LOCATION: (STATE_OFFICE_LOCATION, _mirror_office_location),
+    STATE_CUSTOM_LOCATION: (STATE_CUSTOM_LOCATION, _mirror_custom_location),
+}
+
+
+def _copy_fields(
+    source: dict[str, Any] | None,
+    fields: tuple[tuple[str, str], ...],
+    attrs: dict[str, Any],
+) -> None:
+    """Copy each present ``(field, attr_key)`` of *source* into *attrs*."""
+    if not source:
+        return
+    for field, attr_key in fields:
+        if (value := source.get(field, _MISSING)) is not _MISSING:
+            attrs[attr_key] = value
@@ -50,20 +50,23 @@ class WorkingLocationSensor(CoordinatorEntity[WorkingLocationCoordinator], Senso
     @property
     def native_value(self) -> str | None:
         """Return the current working location state."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.get("state")
+        return data.get("state")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return working location details as state attributes."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return {}
-        attrs = dict(self.coordinator.data.get("attributes", {}))
-        attrs["is_workday"] = self.coordinator.data.get("state") in VALID_STATES
+        attrs = dict(data.get("attributes", {}))
+        attrs["is_workday"] = data.get("state") in VALID_STATES
         return attrs
 
     @property
     def available(self) -> bool:
         """Return False when the last coordinator update failed."""
-        return self.coordinator.last_update_success and self.coordinator.data is not None
+        coordinator = self.coordinator
+        return coordinator.last_update_success and coordinator.data is not None
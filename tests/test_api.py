@@ -71,6 +71,15 @@ class TestGoogleCalendarApiClient:
         )
         mock_resp.raise_for_status.assert_called_once()
 
+    async def test_response_decoded_with_fast_json_loads(self):
+        from custom_components.working_location.api import json_loads
+
+        client, _, mock_resp = self._make_client()
+        await client.async_get_working_location_events(
+            "primary", "2024-01-15T00:00:00+00:00", "2024-01-16T00:00:00+00:00"
+        )
+        mock_resp.json.assert_awaited_once_with(loads=json_loads)
+
     async def test_http_error_propagates(self):
         from aiohttp import ClientResponseError
 
@@ -96,3 +105,166 @@ class TestGoogleCalendarApiClient:
         )
         call_url = session.async_request.call_args[0][1]
         assert call_url == CALENDAR_API_URL.format(calendar_id="primary")
+
+    async def test_token_validated_before_request(self):
+        client, session, _ = self._make_client()
+        await client.async_get_working_location_events(
+            "primary", "2024-01-15T00:00:00+00:00", "2024-01-16T00:00:00+00:00"
+        )
+        session.async_ensure_token_valid.assert_awaited_once()
+
+    async def test_concurrent_requests_do_not_overlap_token_refresh(self):
+        import asyncio
+
+        client, session, _ = self._make_client()
+        active = 0
+        overlapped = False
+
+        async def _refresh():
+            nonlocal active, overlapped
+            active += 1
+            overlapped = overlapped or active > 1
+            await asyncio.sleep(0)
+            active -= 1
+
+        session.async_ensure_token_valid.side_effect = _refresh
+        window = ("primary", "2024-01-15T00:00:00+00:00", "2024-01-16T00:00:00+00:00")
+        await asyncio.gather(
+            client.async_get_working_location_events(*window),
+            client.async_get_working_location_events(*window),
+        )
+        assert session.async_ensure_token_valid.await_count == 2
+        assert not overlapped
+
+
+def _http_error(status: int):
+    from aiohttp import ClientResponseError
+
+    class _FakeError(ClientResponseError):
+        def __init__(self):
+            self.status = status
+            self.message = "Error"
+            self.headers = None
+            self.history = ()
+            self.request_info = MagicMock()
+
+    return _FakeError()
+
+
+class TestGoogleCalendarApiClientSync:
+    """Tests for GoogleCalendarApiClient.async_sync_working_location_events."""
+
+    _WINDOW = ("primary", "2024-01-15T00:00:00+00:00", "2024-01-16T00:00:00+00:00")
+
+    def _make_client(self, *responses):
+        """Return a client whose session returns *responses* in order.
+
+        Each response is either a JSON dict or an exception raised by
+        ``raise_for_status``.
+        """
+        mock_resps = []
+        for response in responses:
+            mock_resp = MagicMock()
+            if isinstance(response, Exception):
+                mock_resp.raise_for_status = MagicMock(side_effect=response)
+            else:
+                mock_resp.raise_for_status = MagicMock()
+                mock_resp.json = AsyncMock(return_value=response)
+            mock_resps.append(mock_resp)
+
+        mock_session = AsyncMock()
+        mock_session.async_request.side_effect = mock_resps
+        return GoogleCalendarApiClient(mock_session), mock_session
+
+    async def test_first_call_is_full_window_fetch(self):
+        payload = {"items": [{"id": "a"}], "nextSyncToken": "tok1"}
+        client, session = self._make_client(payload)
+
+        response, full_sync = await client.async_sync_working_location_events(*self._WINDOW)
+
+        assert response == payload
+        assert full_sync is True
+        params = session.async_request.call_args[1]["params"]
+        assert params["timeMin"] == self._WINDOW[1]
+        assert params["timeMax"] == self._WINDOW[2]
+        assert "syncToken" not in params
+
+    async def test_second_call_uses_sync_token(self):
+        client, session = self._make_client(
+            {"items": [], "nextSyncToken": "tok1"},
+            {"items": [{"id": "b"}], "nextSyncToken": "tok2"},
+        )
+
+        await client.async_sync_working_location_events(*self._WINDOW)
+        response, full_sync = await client.async_sync_working_location_events(*self._WINDOW)
+
+        assert full_sync is False
+        assert response["items"] == [{"id": "b"}]
+        params = session.async_request.call_args[1]["params"]
+        assert params["syncToken"] == "tok1"
+        assert "timeMin" not in params
+        assert "orderBy" not in params
+
+    async def test_expired_sync_token_falls_back_to_full_fetch(self):
+        client, session = self._make_client(
+            {"items": [], "nextSyncToken": "tok1"},
+            _http_error(410),
+            {"items": [{"id": "c"}], "nextSyncToken": "tok2"},
+        )
+
+        await client.async_sync_working_location_events(*self._WINDOW)
+        response, full_sync = await client.async_sync_working_location_events(*self._WINDOW)
+
+        assert full_sync is True
+        assert response["items"] == [{"id": "c"}]
+        assert "timeMin" in session.async_request.call_args[1]["params"]
+
+    async def test_non_410_error_propagates(self):
+        from aiohttp import ClientResponseError
+
+        client, _ = self._make_client(
+            {"items": [], "nextSyncToken": "tok1"},
+            _http_error(500),
+        )
+
+        await client.async_sync_working_location_events(*self._WINDOW)
+        with pytest.raises(ClientResponseError):
+            await client.async_sync_working_location_events(*self._WINDOW)
+
+    async def test_new_window_discards_sync_token(self):
+        client, session = self._make_client(
+            {"items": [], "nextSyncToken": "tok1"},
+            {"items": [], "nextSyncToken": "tok2"},
+        )
+
+        await client.async_sync_working_location_events(*self._WINDOW)
+        _, full_sync = await client.async_sync_working_location_events(
+            "primary", "2024-01-16T00:00:00+00:00", "2024-01-17T00:00:00+00:00"
+        )
+
+        assert full_sync is True
+        assert "syncToken" not in session.async_request.call_args[1]["params"]
+
+    async def test_etag_sent_when_no_sync_token_issued(self):
+        client, session = self._make_client(
+            {"items": [], "etag": '"e1"'},
+            {"items": [], "etag": '"e1"'},
+        )
+
+        await client.async_sync_working_location_events(*self._WINDOW)
+        await client.async_sync_working_location_events(*self._WINDOW)
+
+        headers = session.async_request.call_args[1]["headers"]
+        assert headers == {"If-None-Match": '"e1"'}
+
+    async def test_not_modified_returns_no_changes(self):
+        client, session = self._make_client({"items": [{"id": "a"}], "etag": '"e1"'})
+        await client.async_sync_working_location_events(*self._WINDOW)
+
+        not_modified = MagicMock(status=304)
+        not_modified.json = AsyncMock()
+        session.async_request.side_effect = [not_modified]
+        result = await client.async_sync_working_location_events(*self._WINDOW)
+
+        assert result == ({"items": []}, False)
+        not_modified.json.assert_not_awaited()
@@ -10,9 +10,15 @@ import pytest
 # conftest.py has already patched sys.modules before these imports run.
 from custom_components.working_location.coordinator import (
     WorkingLocationCoordinator,
+    _BOUNDARY_GRACE,
+    _build_event_index,
     _deduplicate_by_day,
+    _drop_identical_events,
     _event_covers_now,
     _extract_state_and_attrs,
+    _midnight_rfc3339,
+    _next_update_interval,
+    _parse_rfc3339,
     _parse_events,
     ConfigEntryAuthFailed,
     UpdateFailed,
@@ -169,6 +175,21 @@ class TestEventCoversNow:
         }
         assert _event_covers_now(event, now) is True
 
+    def test_parsed_times_cached_on_event(self):
+        event = {
+            "start": {"dateTime": _dt(9)},
+            "end": {"dateTime": _dt(17)},
+        }
+        _event_covers_now(event, _NOW)
+        assert event["_start_dt"] == datetime(2024, 1, 15, 9, 0, tzinfo=UTC)
+        assert event["_end_dt"] == datetime(2024, 1, 15, 17, 0, tzinfo=UTC)
+
+        with patch(
+            "custom_components.working_location.coordinator._parse_rfc3339"
+        ) as mock_parse:
+            assert _event_covers_now(event, _NOW) is True
+        mock_parse.assert_not_called()
+
 
 # ===========================================================================
 # _extract_state_and_attrs
@@ -205,6 +226,14 @@ class TestExtractStateAndAttrs:
         assert "officeLocation_floorId" not in attrs
         assert "officeLocation_deskId" not in attrs
 
+    def test_office_location_present_none_field_included(self):
+        wlp = {"type": "officeLocation", "officeLocation": {"deskId": None}}
+        result = _extract_state_and_attrs(_all_day_event(wlp), "primary")
+        attrs = result["attributes"]
+        assert "officeLocation_deskId" in attrs
+        assert attrs["officeLocation_deskId"] is None
+        assert "officeLocation_buildingId" not in attrs
+
     def test_custom_location_with_label(self):
         result = _extract_state_and_attrs(_all_day_event(_CUSTOM_WLP), "primary")
         assert result["state"] == STATE_CUSTOM_LOCATION
@@ -242,6 +271,12 @@ class TestExtractStateAndAttrs:
         result = _extract_state_and_attrs(_all_day_event(wlp), "primary")
         assert result["state"] == STATE_UNKNOWN
 
+    def test_missing_type_still_mirrors_known_fields(self):
+        wlp = {"homeOffice": {}}
+        result = _extract_state_and_attrs(_all_day_event(wlp), "primary")
+        assert result["attributes"]["homeOffice"] == {}
+        assert result["attributes"]["workingLocationProperties"] == wlp
+
     def test_empty_wlp_maps_to_unknown_without_raw_attr(self):
         # wlp is falsy — raw attr should NOT be added
         result = _extract_state_and_attrs(_all_day_event({}), "primary")
@@ -269,6 +304,11 @@ class TestExtractStateAndAttrs:
         assert attrs["start"] == _dt(9)
         assert attrs["end"] == _dt(17)
 
+    def test_attributes_are_read_only(self):
+        result = _extract_state_and_attrs(_all_day_event(_HOME_WLP), "primary")
+        with pytest.raises(TypeError):
+            result["attributes"]["calendar_id"] = "other"
+
     def test_type_attr_absent_when_type_is_none(self):
         # When wlp has no 'type', the 'type' attribute should be absent
         wlp = {}
@@ -288,6 +328,11 @@ class TestParseEvents:
         assert result["state"] == STATE_NONE
         assert result["attributes"]["calendar_id"] == "primary"
 
+    def test_none_state_attributes_are_read_only(self):
+        result = _parse_events([], _NOW, "primary", False)
+        with pytest.raises(TypeError):
+            result["attributes"]["calendar_id"] = "other"
+
     def test_single_all_day_event_is_selected(self):
         events = [_all_day_event(_HOME_WLP)]
         result = _parse_events(events, _NOW, "primary", False)
@@ -360,11 +405,199 @@ class TestParseEvents:
         assert result["state"] == STATE_CUSTOM_LOCATION
         assert result["attributes"]["customLocation_label"] == "Café"
 
+    def test_event_index_sorts_by_start(self):
+        events, (starts, ends) = _build_event_index([
+            _timed_event(12, 18, _OFFICE_WLP, "e2"),
+            _timed_event(8, 12, _HOME_WLP, "e1"),
+            _timed_event(19, 21, _CUSTOM_WLP, "e3"),
+        ])
+        assert [e["id"] for e in events] == ["e1", "e2", "e3"]
+        assert starts == sorted(starts)
+        assert len(ends) == len(events)
+
+    def test_unsorted_input_selects_covering_event(self):
+        events = [
+            _timed_event(12, 18, _OFFICE_WLP, "e2"),
+            _timed_event(8, 12, _HOME_WLP, "e1"),
+            _timed_event(19, 21, _CUSTOM_WLP, "e3"),
+        ]
+        result = _parse_events(events, _NOW, "primary", False)
+        assert result["attributes"]["event_id"] == "e2"
+
+    @pytest.mark.parametrize("hour,expected", [
+        (0, None), (8, None), (9, "e1"), (12, "e2"),
+        (14, "e2"), (17, None), (18, None), (23, None),
+    ])
+    def test_unparseable_and_open_ended_events_never_cover(self, hour, expected):
+        events = [
+            _timed_event(9, 12, _HOME_WLP, "e1"),
+            _timed_event(12, 17, _OFFICE_WLP, "e2"),
+            {"id": "bad", "start": {"dateTime": "nope"}, "end": {"dateTime": _dt(23)}},
+            {"id": "open", "start": {"dateTime": _dt(8)}, "end": {}},
+        ]
+        now = datetime(2024, 1, 15, hour, 0, tzinfo=UTC)
+        result = _parse_events(events, now, "primary", True)
+        assert result["attributes"].get("event_id") == expected
+
+    def test_event_index_all_day_event_sorts_first_and_covers(self):
+        events, _ = _build_event_index([
+            _timed_event(8, 12, _OFFICE_WLP, "e1"),
+            _all_day_event(_HOME_WLP),
+        ])
+        assert events[0]["id"] == "evt-allday"
+        result = _parse_events(events, _NOW, "primary", True)
+        assert result["state"] == STATE_HOME_OFFICE
+
+
+# ===========================================================================
+# _parse_rfc3339
+# ===========================================================================
+
+@pytest.mark.parametrize("use_ciso8601", [True, False])
+@pytest.mark.parametrize("value,expected", [
+    ("2024-01-15T09:00:00Z", datetime(2024, 1, 15, 9, 0, tzinfo=UTC)),
+    (
+        "2024-01-15T09:00:00+05:30",
+        datetime(2024, 1, 15, 9, 0, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+    ),
+    ("not-a-date", None),
+])
+def test_parse_rfc3339_with_and_without_ciso8601(use_ciso8601, value, expected):
+    import custom_components.working_location.coordinator as coordinator_mod
+
+    parser = coordinator_mod.ciso8601_parse_datetime
+    if use_ciso8601 and parser is None:
+        pytest.skip("ciso8601 not installed")
+    _parse_rfc3339.cache_clear()
+    with patch.object(
+        coordinator_mod,
+        "ciso8601_parse_datetime",
+        parser if use_ciso8601 else None,
+    ):
+        assert _parse_rfc3339(value) == expected
+    _parse_rfc3339.cache_clear()
+
+
+def test_parse_rfc3339_reuses_cached_result():
+    _parse_rfc3339.cache_clear()
+    first = _parse_rfc3339("2024-01-15T09:00:00Z")
+    assert _parse_rfc3339("2024-01-15T09:00:00Z") is first
+    assert _parse_rfc3339("not-a-date") is None
+    assert _parse_rfc3339("not-a-date") is None
+    assert _parse_rfc3339.cache_info().hits == 2
+
+
+# ===========================================================================
+# _midnight_rfc3339
+# ===========================================================================
+
+@pytest.mark.parametrize("tz", [
+    UTC,
+    timezone(timedelta(hours=5, minutes=30)),
+    timezone(timedelta(hours=-8)),
+])
+def test_midnight_rfc3339_matches_isoformat(tz):
+    midnight = datetime(2024, 1, 15, tzinfo=tz)
+    assert _midnight_rfc3339(midnight) == midnight.isoformat()
+
+
+# ===========================================================================
+# _next_update_interval
+# ===========================================================================
+
+class TestNextUpdateInterval:
+    """Tests for the adaptive polling helper."""
+
+    _DAY_END = datetime(2024, 1, 16, 0, 0, tzinfo=UTC)
+    _BASE = timedelta(minutes=15)
+    _IDLE = timedelta(minutes=30)
+
+    def _interval(self, events, now=_NOW, consider_none=False):
+        _, index = _build_event_index(events)
+        return _next_update_interval(
+            index, now, self._DAY_END, self._BASE, self._IDLE, consider_none
+        )
+
+    def test_no_boundary_soon_uses_base_interval(self):
+        assert self._interval([_all_day_event(_HOME_WLP)]) == self._BASE
+
+    def test_upcoming_event_end_shortens_interval(self):
+        # _NOW is 14:30; event ends at 14:40
+        event = _timed_event(9, 14, _HOME_WLP)
+        event["end"]["dateTime"] = _dt(14, 40)
+        assert self._interval([event]) == timedelta(minutes=10) + _BOUNDARY_GRACE
+
+    def test_upcoming_event_start_shortens_interval(self):
+        event = _timed_event(15, 17, _HOME_WLP)
+        assert self._interval([event]) == self._BASE
+        now = datetime(2024, 1, 15, 14, 50, tzinfo=UTC)
+        assert self._interval([event], now=now) == timedelta(minutes=10) + _BOUNDARY_GRACE
+
+    def test_interval_never_below_one_minute(self):
+        now = datetime(2024, 1, 15, 16, 59, 50, tzinfo=UTC)
+        event = _timed_event(9, 17, _HOME_WLP)
+        assert self._interval([event], now=now) == timedelta(minutes=1)
+
+    def test_midnight_is_a_boundary(self):
+        now = datetime(2024, 1, 15, 23, 50, tzinfo=UTC)
+        assert self._interval([], now=now) == timedelta(minutes=10) + _BOUNDARY_GRACE
+
+    def test_idle_outside_hours_stretches_to_idle_interval(self):
+        now = datetime(2024, 1, 15, 6, 0, tzinfo=UTC)
+        events = [_timed_event(9, 17, _HOME_WLP)]
+        assert self._interval(events, now=now, consider_none=True) == self._IDLE
+
+    def test_idle_never_shorter_than_base_interval(self):
+        now = datetime(2024, 1, 15, 6, 0, tzinfo=UTC)
+        long_base = timedelta(minutes=120)
+        _, index = _build_event_index([_timed_event(12, 17, _HOME_WLP)])
+        interval = _next_update_interval(
+            index, now, self._DAY_END, long_base, timedelta(minutes=30), True
+        )
+        assert interval == long_base
+
+    def test_idle_stretch_not_applied_when_event_starts_soon(self):
+        now = datetime(2024, 1, 15, 7, 30, tzinfo=UTC)
+        events = [_timed_event(9, 17, _HOME_WLP)]
+        assert self._interval(events, now=now, consider_none=True) == self._BASE
+
+    def test_unparseable_and_open_ended_events_add_no_boundary(self):
+        events = [
+            {"id": "bad", "start": {"dateTime": "nope"}, "end": {"dateTime": _dt(14, 40)}},
+            {"id": "open", "start": {"dateTime": _dt(14, 35)}, "end": {}},
+        ]
+        assert self._interval(events) == self._BASE
+
+    def test_idle_stretch_not_applied_when_all_day_event_covers_now(self):
+        now = datetime(2024, 1, 15, 6, 0, tzinfo=UTC)
+        events = [_all_day_event(_HOME_WLP)]
+        assert self._interval(events, now=now, consider_none=True) == self._BASE
+
+    def test_idle_stretch_not_applied_when_event_covers_now(self):
+        events = [_timed_event(9, 17, _HOME_WLP)]
+        now = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+        assert self._interval(events, now=now, consider_none=True) == self._BASE
+
 
 # ===========================================================================
 # WorkingLocationCoordinator._async_update_data
 # ===========================================================================
 
+@pytest.fixture
+def patched_dt_util():
+    """Patch the coordinator's dt_util once per test, with now() at ``_NOW``.
+
+    Tests that need another time set ``patched_dt_util.now.return_value``.
+    """
+    with patch("custom_components.working_location.coordinator.dt_util") as mock:
+        mock.now.return_value = _NOW
+        mock.parse_datetime.side_effect = lambda s: datetime.fromisoformat(
+            s.replace("Z", "+00:00")
+        )
+        yield mock
+
+
+@pytest.mark.usefixtures("patched_dt_util")
 class TestCoordinatorUpdateData:
     """Tests for the coordinator's async update method."""
 
@@ -377,43 +610,67 @@ class TestCoordinatorUpdateData:
             consider_none_outside_hours=consider_none,
         )
 
-    def _patch_dt_util(self, now: datetime):
-        """Return a patch context manager that fixes dt_util.now() to *now*."""
-        return patch(
-            "custom_components.working_location.coordinator.dt_util",
-            **{
-                "now.return_value": now,
-                "parse_datetime.side_effect": lambda s: datetime.fromisoformat(
-                    s.replace("Z", "+00:00")
-                ),
-            },
-        )
-
     async def test_success_returns_parsed_data(self):
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.return_value = {
-            "items": [_all_day_event(_HOME_WLP)]
-        }
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [_all_day_event(_HOME_WLP)]},
+            True,
+        )
         coord = self._make_coordinator(mock_client)
 
-        with self._patch_dt_util(_NOW):
-            result = await coord._async_update_data()
+        result = await coord._async_update_data()
 
         assert result["state"] == STATE_HOME_OFFICE
         assert result["attributes"]["calendar_id"] == "primary"
 
-    async def test_time_window_spans_today_midnight_to_midnight(self):
+    async def test_update_interval_adapts_to_next_event_boundary(self):
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.return_value = {"items": []}
+        event = _timed_event(9, 14, _HOME_WLP)
+        event["end"]["dateTime"] = _dt(14, 33)
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [event]},
+            True,
+        )
+        coord = self._make_coordinator(mock_client)
+
+        await coord._async_update_data()
+
+        assert coord.update_interval == timedelta(minutes=3) + _BOUNDARY_GRACE
+
+    @pytest.mark.parametrize("hour,consider_none,expected_minutes", [
+        (10, False, 5),  # daytime: no slower than the configured interval
+        (10, True, 5),
+        (2, False, 5),   # no idle stretch without consider_none
+        (2, True, 30),   # idle night: stretched to the default maximum
+    ])
+    async def test_default_options_daytime_and_idle_intervals(
+        self, patched_dt_util, hour, consider_none, expected_minutes
+    ):
+        mock_client = AsyncMock()
+        events = [_all_day_event(_HOME_WLP)] if hour == 10 else []
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": events},
+            True,
+        )
+        coord = self._make_coordinator(mock_client, consider_none=consider_none)
+        patched_dt_util.now.return_value = datetime(2024, 1, 15, hour, 0, tzinfo=UTC)
+
+        await coord._async_update_data()
+
+        assert coord.update_interval == timedelta(minutes=expected_minutes)
+
+    async def test_time_window_spans_today_midnight_to_midnight(self, patched_dt_util):
+        mock_client = AsyncMock()
+        mock_client.async_sync_working_location_events.return_value = ({"items": []}, True)
         coord = self._make_coordinator(mock_client)
 
         now = datetime(2024, 1, 15, 14, 30, tzinfo=timezone(timedelta(hours=5, minutes=30)))
-        with self._patch_dt_util(now):
-            await coord._async_update_data()
+        patched_dt_util.now.return_value = now
+        await coord._async_update_data()
 
-        _, call_kwargs = mock_client.async_get_working_location_events.call_args
+        _, call_kwargs = mock_client.async_sync_working_location_events.call_args
         # positional args: calendar_id, time_min, time_max
-        call_args = mock_client.async_get_working_location_events.call_args[0]
+        call_args = mock_client.async_sync_working_location_events.call_args[0]
         time_min = call_args[1]
         time_max = call_args[2]
 
@@ -422,6 +679,27 @@ class TestCoordinatorUpdateData:
         # time_max should be tomorrow midnight
         assert time_max.startswith("2024-01-16T00:00:00")
 
+    async def test_time_window_rebuilt_when_day_changes(self, patched_dt_util):
+        mock_client = AsyncMock()
+        mock_client.async_sync_working_location_events.return_value = ({"items": []}, True)
+        coord = self._make_coordinator(mock_client)
+
+        await coord._async_update_data()
+        first = mock_client.async_sync_working_location_events.call_args[0]
+
+        patched_dt_util.now.return_value = _NOW + timedelta(hours=1)
+        await coord._async_update_data()
+        same_day = mock_client.async_sync_working_location_events.call_args[0]
+
+        patched_dt_util.now.return_value = _NOW + timedelta(days=1)
+        await coord._async_update_data()
+        next_day = mock_client.async_sync_working_location_events.call_args[0]
+
+        assert same_day == first
+        assert same_day[1] is first[1]  # cached string reused, not rebuilt
+        assert next_day[1] == "2024-01-16T00:00:00+00:00"
+        assert next_day[2] == "2024-01-17T00:00:00+00:00"
+
     async def test_401_raises_config_entry_auth_failed(self):
         from aiohttp import ClientResponseError
 
@@ -434,12 +712,11 @@ class TestCoordinatorUpdateData:
                 self.request_info = MagicMock()
 
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.side_effect = _Err401()
+        mock_client.async_sync_working_location_events.side_effect = _Err401()
         coord = self._make_coordinator(mock_client)
 
-        with self._patch_dt_util(_NOW):
-            with pytest.raises(ConfigEntryAuthFailed):
-                await coord._async_update_data()
+        with pytest.raises(ConfigEntryAuthFailed):
+            await coord._async_update_data()
 
     async def test_403_raises_config_entry_auth_failed(self):
         from aiohttp import ClientResponseError
@@ -453,12 +730,11 @@ class TestCoordinatorUpdateData:
                 self.request_info = MagicMock()
 
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.side_effect = _Err403()
+        mock_client.async_sync_working_location_events.side_effect = _Err403()
         coord = self._make_coordinator(mock_client)
 
-        with self._patch_dt_util(_NOW):
-            with pytest.raises(ConfigEntryAuthFailed):
-                await coord._async_update_data()
+        with pytest.raises(ConfigEntryAuthFailed):
+            await coord._async_update_data()
 
     async def test_non_401_http_error_raises_update_failed(self):
         from aiohttp import ClientResponseError
@@ -472,45 +748,58 @@ class TestCoordinatorUpdateData:
                 self.request_info = MagicMock()
 
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.side_effect = _Err500()
+        mock_client.async_sync_working_location_events.side_effect = _Err500()
         coord = self._make_coordinator(mock_client)
 
-        with self._patch_dt_util(_NOW):
-            with pytest.raises(UpdateFailed):
-                await coord._async_update_data()
+        with pytest.raises(UpdateFailed):
+            await coord._async_update_data()
+
+    async def test_failure_resets_update_interval_to_base(self, patched_dt_util):
+        mock_client = AsyncMock()
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": []},
+            True,
+        )
+        coord = self._make_coordinator(mock_client, consider_none=True)
+        patched_dt_util.now.return_value = datetime(2024, 1, 15, 2, 0, tzinfo=UTC)
+        await coord._async_update_data()
+        assert coord.update_interval == timedelta(minutes=30)  # idle stretch
+
+        mock_client.async_sync_working_location_events.side_effect = RuntimeError("503")
+        with pytest.raises(UpdateFailed):
+            await coord._async_update_data()
+
+        assert coord.update_interval == timedelta(minutes=5)
 
     async def test_generic_exception_raises_update_failed(self):
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.side_effect = RuntimeError("network down")
+        mock_client.async_sync_working_location_events.side_effect = RuntimeError("network down")
         coord = self._make_coordinator(mock_client)
 
-        with self._patch_dt_util(_NOW):
-            with pytest.raises(UpdateFailed):
-                await coord._async_update_data()
+        with pytest.raises(UpdateFailed):
+            await coord._async_update_data()
 
     async def test_empty_response_returns_none_state(self):
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.return_value = {"items": []}
+        mock_client.async_sync_working_location_events.return_value = ({"items": []}, True)
         coord = self._make_coordinator(mock_client)
 
-        with self._patch_dt_util(_NOW):
-            result = await coord._async_update_data()
+        result = await coord._async_update_data()
 
         assert result["state"] == STATE_NONE
 
     async def test_missing_items_key_treated_as_empty(self):
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.return_value = {}  # no "items"
+        mock_client.async_sync_working_location_events.return_value = ({}, True)  # no "items"
         coord = self._make_coordinator(mock_client)
 
-        with self._patch_dt_util(_NOW):
-            result = await coord._async_update_data()
+        result = await coord._async_update_data()
 
         assert result["state"] == STATE_NONE
 
     async def test_calendar_id_passed_to_api(self):
         mock_client = AsyncMock()
-        mock_client.async_get_working_location_events.return_value = {"items": []}
+        mock_client.async_sync_working_location_events.return_value = ({"items": []}, True)
         coord = WorkingLocationCoordinator(
             hass=MagicMock(),
             api_client=mock_client,
@@ -519,12 +808,138 @@ class TestCoordinatorUpdateData:
             consider_none_outside_hours=False,
         )
 
-        with self._patch_dt_util(_NOW):
-            await coord._async_update_data()
+        await coord._async_update_data()
 
-        call_args = mock_client.async_get_working_location_events.call_args[0]
+        call_args = mock_client.async_sync_working_location_events.call_args[0]
         assert call_args[0] == "my_work_cal"
 
+    async def test_incremental_changes_merged_into_cache(self):
+        mock_client = AsyncMock()
+        coord = self._make_coordinator(mock_client)
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [_timed_event(9, 17, _HOME_WLP, "e1")]},
+            True,
+        )
+        await coord._async_update_data()
+
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [_timed_event(9, 17, _OFFICE_WLP, "e1")]},
+            False,
+        )
+        result = await coord._async_update_data()
+
+        assert result["state"] == STATE_OFFICE_LOCATION
+        assert result["attributes"]["event_id"] == "e1"
+
+    async def test_unchanged_selection_reuses_previous_result(self):
+        mock_client = AsyncMock()
+        event = _all_day_event(_HOME_WLP)
+        event["updated"] = "2024-01-10T08:00:00.000Z"
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [event]},
+            True,
+        )
+        coord = self._make_coordinator(mock_client)
+        first = await coord._async_update_data()
+
+        # Same revision re-delivered as a new dict
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [dict(event)]},
+            False,
+        )
+        with patch(
+            "custom_components.working_location.coordinator._extract_state_and_attrs"
+        ) as mock_extract:
+            second = await coord._async_update_data()
+
+        mock_extract.assert_not_called()
+        assert second is first
+
+    async def test_new_revision_rebuilds_result(self):
+        mock_client = AsyncMock()
+        event = _all_day_event(_HOME_WLP)
+        event["updated"] = "2024-01-10T08:00:00.000Z"
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [event]},
+            True,
+        )
+        coord = self._make_coordinator(mock_client)
+        await coord._async_update_data()
+
+        changed = {
+            **_all_day_event(_OFFICE_WLP),
+            "updated": "2024-01-15T09:00:00.000Z",
+        }
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [changed]},
+            False,
+        )
+        result = await coord._async_update_data()
+
+        assert result["state"] == STATE_OFFICE_LOCATION
+
+    async def test_incremental_cancelled_event_removed(self):
+        mock_client = AsyncMock()
+        coord = self._make_coordinator(mock_client)
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [_timed_event(9, 17, _HOME_WLP, "e1")]},
+            True,
+        )
+        await coord._async_update_data()
+
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [{"id": "e1", "status": "cancelled"}]},
+            False,
+        )
+        result = await coord._async_update_data()
+
+        assert result["state"] == STATE_NONE
+
+    async def test_incremental_change_outside_today_ignored(self):
+        mock_client = AsyncMock()
+        coord = self._make_coordinator(mock_client)
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [_all_day_event(_HOME_WLP)]},
+            True,
+        )
+        await coord._async_update_data()
+
+        next_week = {
+            "id": "evt-next-week",
+            "start": {"date": "2024-01-22"},
+            "end": {"date": "2024-01-23"},
+            "workingLocationProperties": _OFFICE_WLP,
+        }
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [next_week]},
+            False,
+        )
+        result = await coord._async_update_data()
+
+        assert result["state"] == STATE_HOME_OFFICE
+        assert result["attributes"]["event_id"] == "evt-allday"
+
+    async def test_incremental_timed_event_moved_out_of_today_removed(self):
+        mock_client = AsyncMock()
+        coord = self._make_coordinator(mock_client)
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [_timed_event(9, 17, _HOME_WLP, "e1")]},
+            True,
+        )
+        await coord._async_update_data()
+
+        moved = _timed_event(9, 17, _HOME_WLP, "e1")
+        moved["start"]["dateTime"] = "2024-01-16T09:00:00+00:00"
+        moved["end"]["dateTime"] = "2024-01-16T17:00:00+00:00"
+        mock_client.async_sync_working_location_events.return_value = (
+            {"items": [moved]},
+            False,
+        )
+        result = await coord._async_update_data()
+
+        assert result["state"] == STATE_NONE
+        assert coord._events_cache == {}
+
 
 # ---------------------------------------------------------------------------
 # _deduplicate_by_day
@@ -571,3 +986,32 @@ def test_dedup_parse_events_sees_only_standalone():
     deduplicated = _deduplicate_by_day([recurring, standalone])
     result = _parse_events(deduplicated, _NOW, "primary", False)
     assert result["state"] == STATE_OFFICE_LOCATION
+
+
+# ---------------------------------------------------------------------------
+# _drop_identical_events
+# ---------------------------------------------------------------------------
+
+def test_drop_identical_events_keeps_first_of_duplicates():
+    first = _timed_event(9, 17, _HOME_WLP, "a")
+    events = [first, _timed_event(9, 17, _HOME_WLP, "b")]
+    assert _drop_identical_events(events) == [first]
+
+
+def test_drop_identical_events_keeps_distinct_events():
+    events = [
+        _timed_event(9, 17, _HOME_WLP, "a"),
+        _timed_event(9, 17, _OFFICE_WLP, "b"),
+        _timed_event(9, 12, _HOME_WLP, "c"),
+    ]
+    assert _drop_identical_events(events) == events
+
+
+def test_drop_identical_events_ignores_property_key_order():
+    first = _timed_event(9, 17, _OFFICE_WLP, "a")
+    reordered = {
+        "officeLocation": dict(reversed(list(_OFFICE_WLP["officeLocation"].items()))),
+        "type": "officeLocation",
+    }
+    events = [first, _timed_event(9, 17, reordered, "b")]
+    assert _drop_identical_events(events) == [first]
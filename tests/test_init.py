@@ -0,0 +1,119 @@
+"""Tests for __init__.py — config entry setup."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# conftest.py has already patched sys.modules before these imports run.
+from custom_components.working_location import (
+    _REFRESH_LOCKS,
+    async_remove_entry,
+    async_setup_entry,
+)
+from custom_components.working_location.const import CONF_BLOCK_ON_FIRST_REFRESH, DOMAIN
+from custom_components.working_location.coordinator import (
+    ConfigEntryAuthFailed,
+    UpdateFailed,
+)
+from homeassistant.exceptions import ConfigEntryNotReady
+
+
+_ENTRY_ID = "test_entry_id"
+
+
+def _make_hass():
+    hass = MagicMock()
+    hass.data = {}
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    return hass
+
+
+def _make_entry(options=None):
+    entry = MagicMock()
+    entry.entry_id = _ENTRY_ID
+    entry.options = options or {}
+    return entry
+
+
+@pytest.fixture
+def coordinator():
+    """Patch out OAuth and the coordinator; yield the coordinator stand-in."""
+    coord = SimpleNamespace(
+        async_refresh=AsyncMock(),
+        async_request_refresh=MagicMock(),
+        last_update_success=True,
+        last_exception=None,
+    )
+    oauth = MagicMock()
+    oauth.async_get_config_entry_implementation = AsyncMock()
+    oauth.OAuth2Session.return_value = SimpleNamespace(
+        async_ensure_token_valid=AsyncMock()
+    )
+    with patch(
+        "custom_components.working_location.config_entry_oauth2_flow", oauth
+    ), patch(
+        "custom_components.working_location.WorkingLocationCoordinator",
+        return_value=coord,
+    ):
+        yield coord
+    _REFRESH_LOCKS.pop(_ENTRY_ID, None)
+
+
+class TestAsyncSetupEntry:
+    """Tests for the initial-refresh branches of async_setup_entry."""
+
+    async def test_default_refreshes_in_background(self, coordinator):
+        hass = _make_hass()
+        entry = _make_entry()
+
+        assert await async_setup_entry(hass, entry) is True
+
+        coordinator.async_refresh.assert_not_called()
+        coordinator.async_request_refresh.assert_called_once()
+        entry.async_create_background_task.assert_called_once()
+        assert hass.data[DOMAIN][_ENTRY_ID] is coordinator
+        hass.config_entries.async_forward_entry_setups.assert_awaited_once()
+
+    async def test_block_on_first_refresh_awaits_refresh(self, coordinator):
+        hass = _make_hass()
+        entry = _make_entry({CONF_BLOCK_ON_FIRST_REFRESH: True})
+
+        assert await async_setup_entry(hass, entry) is True
+
+        coordinator.async_refresh.assert_awaited_once()
+        entry.async_create_background_task.assert_not_called()
+        assert hass.data[DOMAIN][_ENTRY_ID] is coordinator
+
+    async def test_block_on_first_refresh_auth_failure(self, coordinator):
+        coordinator.last_update_success = False
+        coordinator.last_exception = ConfigEntryAuthFailed("revoked")
+        hass = _make_hass()
+
+        with pytest.raises(ConfigEntryAuthFailed):
+            await async_setup_entry(
+                hass, _make_entry({CONF_BLOCK_ON_FIRST_REFRESH: True})
+            )
+        assert DOMAIN not in hass.data
+
+    async def test_block_on_first_refresh_other_failure_not_ready(self, coordinator):
+        coordinator.last_update_success = False
+        coordinator.last_exception = UpdateFailed("HTTP 500")
+        hass = _make_hass()
+
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(
+                hass, _make_entry({CONF_BLOCK_ON_FIRST_REFRESH: True})
+            )
+        assert DOMAIN not in hass.data
+
+    async def test_remove_entry_drops_refresh_lock(self, coordinator):
+        entry = _make_entry()
+        await async_setup_entry(_make_hass(), entry)
+        assert _ENTRY_ID in _REFRESH_LOCKS
+
+        await async_remove_entry(_make_hass(), entry)
+
+        assert _ENTRY_ID not in _REFRESH_LOCKS
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -17,17 +17,15 @@ from custom_components.working_location.const import (
 
 
 def _make_coordinator(state: str, attrs: dict, last_update_success: bool = True):
-    """Build a minimal mock coordinator with the given data."""
-    coord = MagicMock()
-    coord.data = {"state": state, "attributes": attrs}
-    coord.last_update_success = last_update_success
-    return coord
+    """Build a minimal stand-in coordinator with the given data."""
+    return SimpleNamespace(
+        data={"state": state, "attributes": attrs},
+        last_update_success=last_update_success,
+    )
 
 
 def _make_entry(entry_id: str = "test_entry_id"):
-    entry = MagicMock()
-    entry.entry_id = entry_id
-    return entry
+    return SimpleNamespace(entry_id=entry_id)
 
 
 def _make_sensor(state=STATE_HOME_OFFICE, attrs=None, last_update_success=True, entry_id="eid"):
@@ -58,9 +56,7 @@ class TestWorkingLocationSensorValue:
         assert sensor.native_value == STATE_UNKNOWN
 
     def test_native_value_is_none_when_coordinator_data_is_none(self):
-        coord = MagicMock()
-        coord.data = None
-        coord.last_update_success = True
+        coord = SimpleNamespace(data=None, last_update_success=True)
         sensor = WorkingLocationSensor(coord, _make_entry(), "primary")
         assert sensor.native_value is None
 
@@ -78,9 +74,7 @@ class TestWorkingLocationSensorValue:
         assert result == {**attrs, "is_workday": True}
 
     def test_extra_state_attributes_empty_when_coordinator_data_is_none(self):
-        coord = MagicMock()
-        coord.data = None
-        coord.last_update_success = True
+        coord = SimpleNamespace(data=None, last_update_success=True)
         sensor = WorkingLocationSensor(coord, _make_entry(), "primary")
         assert sensor.extra_state_attributes == {}
 
@@ -96,9 +90,10 @@ class TestWorkingLocationSensorValue:
         assert sensor.extra_state_attributes["is_workday"] is expected
 
     def test_extra_state_attributes_empty_dict_when_attributes_key_missing(self):
-        coord = MagicMock()
-        coord.data = {"state": STATE_NONE}  # no "attributes" key
-        coord.last_update_success = True
+        coord = SimpleNamespace(
+            data={"state": STATE_NONE},  # no "attributes" key
+            last_update_success=True,
+        )
         sensor = WorkingLocationSensor(coord, _make_entry(), "primary")
         assert sensor.extra_state_attributes == {"is_workday": False}
 
@@ -115,16 +110,12 @@ class TestWorkingLocationSensorAvailability:
         assert sensor.available is False
 
     def test_available_false_when_coordinator_data_is_none(self):
-        coord = MagicMock()
-        coord.data = None
-        coord.last_update_success = True
+        coord = SimpleNamespace(data=None, last_update_success=True)
         sensor = WorkingLocationSensor(coord, _make_entry(), "primary")
         assert sensor.available is False
 
     def test_available_false_when_both_conditions_fail(self):
-        coord = MagicMock()
-        coord.data = None
-        coord.last_update_success = False
+        coord = SimpleNamespace(data=None, last_update_success=False)
         sensor = WorkingLocationSensor(coord, _make_entry(), "primary")
         assert sensor.available is False
 
@@ -152,3 +143,9 @@ class TestWorkingLocationSensorIdentity:
     def test_icon(self):
         sensor = _make_sensor()
         assert sensor._attr_icon == "mdi:briefcase-clock"
+
+    def test_static_attributes_live_on_class(self):
+        sensor = _make_sensor()
+        for name in ("_attr_name", "_attr_icon", "_attr_has_entity_name"):
+            assert name in WorkingLocationSensor.__dict__
+            assert name not in vars(sensor)